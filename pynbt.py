@@ -17,160 +17,77 @@ __all__ = (
     'TAG_Int_Array',
     'TAG_Long_Array'
 )
-from functools import partial
-from struct import unpack, pack
+import sys
+from array import array
+from functools import lru_cache
+from struct import Struct, error as StructError
 
 import mutf8
 
 
 class BaseTag(object):
+    # Empty so that subclasses declaring __slots__ really do go without a
+    # per-instance __dict__.
+    __slots__ = ()
+
     def __init__(self, value, name=None):
         self.name = name
         self.value = value
 
-    @staticmethod
-    def _read_utf8(read):
-        """Reads a length-prefixed MUTF-8 string."""
-        name_length = read('h', 2)[0]
-        return mutf8.decode_modified_utf8(read.src.read(name_length))
-
     @staticmethod
     def _write_utf8(write, value):
         """Writes a length-prefixed MUTF-8 string."""
         encoded_value = mutf8.encode_modified_utf8(value)
-        write('h', len(encoded_value))
-        write.dst.write(encoded_value)
+        write('H', len(encoded_value))
+        write.bytes(encoded_value)
 
     @classmethod
     def read(cls, read, has_name=True):
         """
-        Read the tag in using the reader `rd`.
+        Read the tag in using the reader `read`.
         If `has_name` is `False`, skip reading the tag name.
         """
-        name = cls._read_utf8(read) if has_name else None
-
-        if cls is TAG_Compound:
-            # A TAG_Compound is almost identical to Python's native dict()
-            # object, or a Java HashMap.
-            final = {}
-            while True:
-                # Find the type of each tag in a compound in turn.
-                tag = read('b', 1)[0]
-                if tag == 0:
-                    # A tag of 0 means we've reached TAG_End, used to terminate
-                    # a TAG_Compound.
-                    break
-                # We read in each tag in turn, using its name as the key in
-                # the dict (Since a compound cannot have repeating names,
-                # this works fine).
-                tmp = _tags[tag].read(read)
-                final[tmp.name] = tmp
-            return cls(final, name=name)
-        elif cls is TAG_List:
-            # A TAG_List is a very simple homogeneous array, similar to
-            # Python's native list() object, but restricted to a single type.
-            tag_type, length = read('bi', 5)
-            tag_read = _tags[tag_type].read
-            return cls(
-                _tags[tag_type],
-                [tag_read(read, has_name=False) for x in range(0, length)],
-                name=name
-            )
-        elif cls is TAG_String:
-            # A simple length-prefixed UTF-8 string.
-            value = cls._read_utf8(read)
-            return cls(value, name=name)
-        elif cls is TAG_Byte_Array:
-            # A simple array of (signed) bytes.
-            length = read('i', 4)[0]
-            return cls(bytearray(read.src.read(length)), name=name)
-        elif cls is TAG_Int_Array:
-            # A simple array of (signed) 4-byte integers.
-            length = read('i', 4)[0]
-            return cls(read('{0}i'.format(length), length * 4), name=name)
-        elif cls is TAG_Long_Array:
-            # A simple array of (signed) 8-byte longs.
-            length = read('i', 4)[0]
-            return cls(read('{0}q'.format(length), length * 8), name=name)
-        elif cls is TAG_Byte:
-            # A single (signed) byte.
-            return cls(read('b', 1)[0], name=name)
-        elif cls is TAG_Short:
-            # A single (signed) short.
-            return cls(read('h', 2)[0], name=name)
-        elif cls is TAG_Int:
-            # A signed (signed) 4-byte int.
-            return cls(read('i', 4)[0], name=name)
-        elif cls is TAG_Long:
-            # A single (signed) 8-byte long.
-            return cls(read('q', 8)[0], name=name)
-        elif cls is TAG_Float:
-            # A single single-precision floating point value.
-            return cls(read('f', 4)[0], name=name)
-        elif cls is TAG_Double:
-            # A single double-precision floating point value.
-            return cls(read('d', 8)[0], name=name)
-        elif cls is TAG_End:
-            # A End of Compound Tag
-            return cls(read('2b', 2)[0], name=name)
+        name = sys.intern(_read_utf8(read)) if has_name else None
+        return _readers[cls.TAG_ID](read, name)
 
     def write(self, write):
         # Only write the name TAG_String if our name is not `None`.
         # If you want a blank name, use ''.
         if self.name is not None:
-            if isinstance(self, NBTFile):
-                write('b', 0x0A)
-            else:
-                write('b', _tags.index(self.__class__))
-            self._write_utf8(write, self.name)
-        if isinstance(self, TAG_List):
-            write('bi', _tags.index(self.type_), len(self.value))
-            for item in self.value:
-                # If our list item isn't of type self._type, convert
-                # it before writing.
-                if not isinstance(item, self.type_):
-                    item = self.type_(item)
-                item.write(write)
-        elif isinstance(self, TAG_Compound):
-            for v in self.value.values():
-                v.write(write)
-            # A tag of type 0 (TAg_End) terminates a TAG_Compound.
-            write('b', 0)
-        elif isinstance(self, TAG_String):
-            self._write_utf8(write, self.value)
-        elif isinstance(self, TAG_Int_Array):
-            length = len(self.value)
-            write('i{0}i'.format(length), length, *self.value)
-        elif isinstance(self, TAG_Long_Array):
-            length = len(self.value)
-            write('i{0}q'.format(length), length, *self.value)
-        elif isinstance(self, TAG_Byte_Array):
-            write('i', len(self.value))
-            write.dst.write(bytes(self.value))
-        elif isinstance(self, TAG_Byte):
-            write('b', self.value)
-        elif isinstance(self, TAG_Short):
-            write('h', self.value)
-        elif isinstance(self, TAG_Int):
-            write('i', self.value)
-        elif isinstance(self, TAG_Long):
-            write('q', self.value)
-        elif isinstance(self, TAG_Float):
-            write('f', self.value)
-        elif isinstance(self, TAG_Double):
-            write('d', self.value)
+            # The type, name length and name are emitted together rather
+            # than through _write_utf8().
+            encoded_name = _encode_name(self.name)
+            write('bH', self.TAG_ID, len(encoded_name))
+            write.bytes(encoded_name)
+        self._write_payload(write)
+
+    def _write_payload(self, write):
+        """
+        Writes the tag's value, without its type or name. Each tag type
+        overrides this as needed; the default handles the scalar tags.
+        """
+        write(_scalar_formats[self.TAG_ID], self.value)
 
     def pretty(self, indent=0, indent_str='  '):
         """
         Pretty-print a tag in the same general style as Markus's example
         output.
         """
-        return '{0}{1}({2!r}): {3!r}'.format(
+        out = []
+        self._pretty(out, indent, indent_str)
+        return '\n'.join(out)
+
+    def _pretty(self, out, indent, indent_str):
+        """
+        Appends the pretty-printed lines for this tag to `out`. Nested tags
+        append to the same list, so the output is only joined once.
+        """
+        out.append('{0}{1}({2!r}): {3!r}'.format(
             indent_str * indent,
             self.__class__.__name__,
             self.name,
             self.value
-        )
+        ))
 
     def __repr__(self):
         return '{0}({1!r}, {2!r})'.format(
@@ -205,40 +122,101 @@ class TAG_Double(BaseTag):
 
 
 class TAG_Byte_Array(BaseTag):
-    def pretty(self, indent=0, indent_str='  '):
-        return '{0}TAG_Byte_Array({1!r}): [{2} bytes]'.format(
-            indent_str * indent, self.name, len(self.value))
+    __slots__ = ('name', 'value')
+
+    def _write_payload(self, write):
+        write('i', len(self.value))
+        write.bytes(self.value)
+
+    def _pretty(self, out, indent, indent_str):
+        out.append('{0}TAG_Byte_Array({1!r}): [{2} bytes]'.format(
+            indent_str * indent, self.name, len(self.value)))
 
 
 class TAG_String(BaseTag):
     __slots__ = ('name', 'value')
 
+    def _write_payload(self, write):
+        self._write_utf8(write, self.value)
+
 
 class TAG_End(BaseTag):
     __slots__ = ('name', 'value')
 
+    def _write_payload(self, write):
+        # TAG_End has no payload.
+        pass
+
 
 class TAG_List(BaseTag, list):
+    __slots__ = ('name', 'type_')
+
     def __init__(self, tag_type, value=None, name=None):
         """
         Creates a new homogeneous list of `tag_type` items, copying `value`
         if provided.
         """
         self.name = name
-        self.value = self
         self.type_ = tag_type
         if value is not None:
             self.extend(value)
 
-    def pretty(self, indent=0, indent_str='  '):
-        t = []
-        t.append('{0}TAG_List({1!r}): {2} entries'.format(
-            indent_str * indent, self.name, len(self.value)))
-        t.append('{0}{{'.format(indent_str * indent))
-        for v in self.value:
-            t.append(v.pretty(indent + 1, indent_str))
-        t.append('{0}}}'.format(indent_str * indent))
-        return '\n'.join(t)
+    @property
+    def value(self):
+        """
+        The list is its own value. This is a property rather than an
+        attribute pointing back at `self`, which would make every list a
+        reference cycle that only the cyclic GC could free.
+        """
+        return self
+
+    @value.setter
+    def value(self, value):
+        self[:] = value
+
+    def _pretty(self, out, indent, indent_str):
+        out.append('{0}TAG_List({1!r}): {2} entries'.format(
+            indent_str * indent, self.name, len(self)))
+        out.append('{0}{{'.format(indent_str * indent))
+        for v in self:
+            v._pretty(out, indent + 1, indent_str)
+        out.append('{0}}}'.format(indent_str * indent))
+
+    def _write_payload(self, write):
+        tag = self.type_
+        write('bi', tag.TAG_ID, len(self))
+        fmt = _scalar_formats[tag.TAG_ID]
+        if fmt is not None:
+            # Lists of scalars are written in one block, the same way
+            # they're read.
+            values = [
+                item.value if isinstance(item, tag) else item
+                for item in self
+            ]
+            if fmt == 'f':
+                # array('f') silently rounds out of range values to inf,
+                # whereas struct raises just as a lone TAG_Float would.
+                write('{0}f'.format(len(values)), *values)
+                return
+            try:
+                values = array(fmt, values)
+            except OverflowError as e:
+                # Raise what struct would for a lone tag that's out of range.
+                raise StructError(str(e)) from None
+            if write.swap:
+                values.byteswap()
+            write.bytes(values)
+            return
+
+        for item in self:
+            # If our list item isn't of type self._type, convert
+            # it before writing. The exact type check is tried first as
+            # it's by far the common case.
+            if type(item) is not tag and not isinstance(item, tag):
+                item = tag(item)
+            # Items in a list never have a name, so skip straight to the
+            # payload.
+            item._write_payload(write)
 
     def __repr__(self):
         return '{0}({1!r} entries, {2!r})'.format(
@@ -246,21 +224,37 @@ class TAG_List(BaseTag, list):
 
 
 class TAG_Compound(BaseTag, dict):
+    __slots__ = ('name',)
+
     def __init__(self, value=None, name=None):
         self.name = name
-        self.value = self
         if value is not None:
             self.update(value)
 
-    def pretty(self, indent=0, indent_str='  '):
-        t = []
-        t.append('{0}TAG_Compound({1!r}): {2} entries'.format(
-            indent_str * indent, self.name, len(self.value)))
-        t.append('{0}{{'.format(indent_str * indent))
+    @property
+    def value(self):
+        """The compound is its own value, see `TAG_List.value`."""
+        return self
+
+    @value.setter
+    def value(self, value):
+        if value is not self:
+            self.clear()
+            self.update(value)
+
+    def _pretty(self, out, indent, indent_str):
+        out.append('{0}TAG_Compound({1!r}): {2} entries'.format(
+            indent_str * indent, self.name, len(self)))
+        out.append('{0}{{'.format(indent_str * indent))
         for v in self.values():
-            t.append(v.pretty(indent + 1, indent_str))
-        t.append('{0}}}'.format(indent_str * indent))
-        return '\n'.join(t)
+            v._pretty(out, indent + 1, indent_str)
+        out.append('{0}}}'.format(indent_str * indent))
+
+    def _write_payload(self, write):
+        for v in self.values():
+            v.write(write)
+        # A tag of type 0 (TAg_End) terminates a TAG_Compound.
+        write('b', 0)
 
     def __repr__(self):
         return '{0}({1!r} entries, {2!r})'.format(
@@ -276,24 +270,48 @@ class TAG_Compound(BaseTag, dict):
             value.name = key
         super(TAG_Compound, self).__setitem__(key, value)
 
+    @classmethod
+    def _from_dict(cls, value, name=None):
+        """
+        Creates a compound from a dict of tags that are already named, as
+        when reading, skipping the naming done by `update()`.
+        """
+        compound = cls.__new__(cls)
+        compound.name = name
+        dict.update(compound, value)
+        return compound
+
     def update(self, *args, **kwargs):
         """See `__setitem__`."""
-        super(TAG_Compound, self).update(*args, **kwargs)
-        for key, item in self.items():
+        # Only name the incoming tags, rather than rescanning everything
+        # already in the compound afterwards.
+        value = dict(*args, **kwargs)
+        for key, item in value.items():
             if item.name is None:
                 item.name = key
+        super(TAG_Compound, self).update(value)
 
 
 class TAG_Int_Array(BaseTag):
-    def pretty(self, indent=0, indent_str='  '):
-        return '{0}TAG_Int_Array({1!r}): [{2} integers]'.format(
-            indent_str * indent, self.name, len(self.value))
+    __slots__ = ('name', 'value')
+
+    def _write_payload(self, write):
+        _write_array(write, self.value, 'i')
+
+    def _pretty(self, out, indent, indent_str):
+        out.append('{0}TAG_Int_Array({1!r}): [{2} integers]'.format(
+            indent_str * indent, self.name, len(self.value)))
 
 
 class TAG_Long_Array(BaseTag):
-    def pretty(self, indent=0, indent_str='  '):
-        return '{0}TAG_Long_Array({1!r}): [{2} longs]'.format(
-            indent_str * indent, self.name, len(self.value))
+    __slots__ = ('name', 'value')
+
+    def _write_payload(self, write):
+        _write_array(write, self.value, 'q')
+
+    def _pretty(self, out, indent, indent_str):
+        out.append('{0}TAG_Long_Array({1!r}): [{2} longs]'.format(
+            indent_str * indent, self.name, len(self.value)))
 
 
 # The TAG_* types have the convienient property of being continuous.
@@ -315,24 +333,392 @@ _tags = (
     TAG_Long_Array   # 0x0C
 )
 
+# Record each tag's id on the class itself, so writing a tag doesn't need
+# to search _tags for it. Subclasses (such as NBTFile) inherit their id.
+for _tag_id, _tag in enumerate(_tags):
+    _tag.TAG_ID = _tag_id
+del _tag_id, _tag
 
-def _read_little(src, fmt, size):
-    return unpack('<' + fmt, src.read(size))
 
+def _read_utf8(read):
+    """Reads a length-prefixed MUTF-8 string."""
+    # Strings (and so every name) come through here, so the length and the
+    # string itself are taken straight from the buffer.
+    buf = read.buf
+    start = read.pos + 2
+    length = read.structs['H'].unpack_from(buf, read.pos)[0]
+    end = start + length
+    _check_span(buf, start, end)
+    read.pos = end
+    return mutf8.decode_modified_utf8(buf[start:end])
+
+
+def _read_end(read, name):
+    # A End of Compound Tag
+    return TAG_End(read('2b', 2)[0], name=name)
+
+
+def _read_byte(read, name):
+    # A single (signed) byte.
+    return TAG_Byte(read('b', 1)[0], name=name)
+
+
+def _read_short(read, name):
+    # A single (signed) short.
+    return TAG_Short(read('h', 2)[0], name=name)
+
+
+def _read_int(read, name):
+    # A signed (signed) 4-byte int.
+    return TAG_Int(read('i', 4)[0], name=name)
+
+
+def _read_long(read, name):
+    # A single (signed) 8-byte long.
+    return TAG_Long(read('q', 8)[0], name=name)
+
+
+def _read_float(read, name):
+    # A single single-precision floating point value.
+    return TAG_Float(read('f', 4)[0], name=name)
+
+
+def _read_double(read, name):
+    # A single double-precision floating point value.
+    return TAG_Double(read('d', 8)[0], name=name)
+
+
+def _read_byte_array(read, name):
+    # A simple array of (signed) bytes.
+    #
+    # The array readers take their length prefix straight from the buffer
+    # rather than calling through the reader.
+    buf = read.buf
+    start = read.pos + 4
+    length = read.structs['i'].unpack_from(buf, read.pos)[0]
+    end = start + length
+    _check_span(buf, start, end)
+    read.pos = end
+    return TAG_Byte_Array(bytearray(buf[start:end]), name=name)
+
+
+def _read_string(read, name):
+    # A simple length-prefixed UTF-8 string.
+    return TAG_String(_read_utf8(read), name=name)
+
+
+def _read_list(read, name):
+    # A TAG_List is a very simple homogeneous array, similar to
+    # Python's native list() object, but restricted to a single type.
+    pos = read.pos
+    tag_type, length = read.structs['bi'].unpack_from(read.buf, pos)
+    read.pos = pos + 5
+    tag = _tags[tag_type]
+    fmt = _scalar_formats[tag_type]
+    if fmt is not None:
+        # Lists of scalars are fixed-size, so every element can be
+        # unpacked at once rather than read one at a time. As with
+        # range(0, length) below, a negative length is an empty list.
+        if length <= 0:
+            return TAG_List(tag, name=name)
+        values = array(fmt)
+        values.frombytes(read.bytes(length * values.itemsize))
+        if read.swap:
+            values.byteswap()
+        return TAG_List(tag, [tag(v) for v in values], name=name)
+
+    tag_read = _readers[tag_type]
+    return TAG_List(
+        tag,
+        [tag_read(read, None) for x in range(0, length)],
+        name=name
+    )
+
+
+def _read_compound(read, name):
+    # A TAG_Compound is almost identical to Python's native dict()
+    # object, or a Java HashMap.
+    #
+    # This is the hottest loop when parsing, so the globals it needs are
+    # bound to locals up front.
+    tags = _tags
+    readers = _readers
+    decode = mutf8.decode_modified_utf8
+    intern = sys.intern
+    formats = _scalar_formats
+    buf = read.buf
+    buf_length = len(buf)
+    structs = read.structs
+    prefix = structs.prefix
+    name_length_struct = structs['H']
+    final = {}
+    while True:
+        # Find the type of each tag in a compound in turn. It's a single
+        # byte, so we can take it straight from the buffer without going
+        # through struct at all.
+        pos = read.pos
+        if pos >= buf_length:
+            # The payload ended before the compound's TAG_End.
+            _check_span(buf, pos, pos + 1)
+        tag = buf[pos]
+        if tag == 0:
+            # A tag of 0 means we've reached TAG_End, used to terminate
+            # a TAG_Compound.
+            read.pos = pos + 1
+            break
+        # We read in each tag in turn, using its name as the key in
+        # the dict (Since a compound cannot have repeating names,
+        # this works fine). The same few names ("id", "Count", "x", ...)
+        # repeat throughout a file, so they're interned to share a single
+        # string and speed up lookups.
+        name_length = name_length_struct.unpack_from(buf, pos + 1)[0]
+        fmt = formats[tag]
+        if fmt is not None:
+            # Most tags are scalars, for which the name and the value can be
+            # unpacked together in one go.
+            s = _get_named_struct(prefix, name_length, fmt)
+            raw_name, value = s.unpack_from(buf, pos + 3)
+            read.pos = pos + 3 + s.size
+            key = intern(decode(raw_name))
+            final[key] = tags[tag](value, key)
+        elif tag == 0x08:
+            # Strings are the next most common, and are just as easily
+            # decoded in place, without a call to _read_string().
+            start = pos + 3
+            end = start + name_length
+            _check_span(buf, start, end)
+            key = intern(decode(buf[start:end]))
+            length = name_length_struct.unpack_from(buf, end)[0]
+            start = end + 2
+            end = start + length
+            _check_span(buf, start, end)
+            read.pos = end
+            final[key] = TAG_String(decode(buf[start:end]), key)
+        else:
+            # Otherwise the name is sliced out here, rather than going
+            # through _read_utf8(), and the payload is left to its reader.
+            start = pos + 3
+            end = start + name_length
+            _check_span(buf, start, end)
+            read.pos = end
+            key = intern(decode(buf[start:end]))
+            final[key] = readers[tag](read, key)
+    return TAG_Compound._from_dict(final, name)
+
+
+def _read_int_array(read, name):
+    # A simple array of (signed) 4-byte integers, copied straight out of the
+    # buffer into an array() rather than boxed one by one into a tuple.
+    buf = read.buf
+    start = read.pos + 4
+    length = read.structs['i'].unpack_from(buf, read.pos)[0]
+    end = start + length * 4
+    _check_span(buf, start, end)
+    read.pos = end
+    value = array('i')
+    value.frombytes(buf[start:end])
+    if read.swap:
+        value.byteswap()
+    return TAG_Int_Array(value, name=name)
+
+
+def _read_long_array(read, name):
+    # A simple array of (signed) 8-byte longs, read the same way as
+    # TAG_Int_Array.
+    buf = read.buf
+    start = read.pos + 4
+    length = read.structs['i'].unpack_from(buf, read.pos)[0]
+    end = start + length * 8
+    _check_span(buf, start, end)
+    read.pos = end
+    value = array('q')
+    value.frombytes(buf[start:end])
+    if read.swap:
+        value.byteswap()
+    return TAG_Long_Array(value, name=name)
+
+
+# The struct format of each scalar tag's payload, indexed by tag id, or
+# `None` for tags whose payload isn't a single fixed-size value.
+_scalar_formats = (
+    None,  # 0x00
+    'b',   # 0x01
+    'h',   # 0x02
+    'i',   # 0x03
+    'q',   # 0x04
+    'f',   # 0x05
+    'd',   # 0x06
+    None,  # 0x07
+    None,  # 0x08
+    None,  # 0x09
+    None,  # 0x0A
+    None,  # 0x0B
+    None   # 0x0C
+)
+
+# Payload readers, indexed by tag id just like _tags. Dispatching through
+# this table avoids walking a chain of `cls is TAG_*` checks for every tag.
+_readers = (
+    _read_end,          # 0x00
+    _read_byte,         # 0x01
+    _read_short,        # 0x02
+    _read_int,          # 0x03
+    _read_long,         # 0x04
+    _read_float,        # 0x05
+    _read_double,       # 0x06
+    _read_byte_array,   # 0x07
+    _read_string,       # 0x08
+    _read_list,         # 0x09
+    _read_compound,     # 0x0A
+    _read_int_array,    # 0x0B
+    _read_long_array    # 0x0C
+)
+
+
+@lru_cache(maxsize=256)
+def _get_struct(fmt):
+    """
+    Returns a compiled `Struct` for `fmt`, caching it so that the format
+    string is only parsed once no matter how many tags use it.
+    """
+    return Struct(fmt)
+
+
+class _StructTable(dict):
+    """
+    Compiled `Struct`s for a single byte order, keyed by their format
+    without the byte order prefix.
+
+    Every fixed format PyNBT uses is compiled up front, so selecting the
+    table once per file means no string concatenation on each read or
+    write. The only format that varies with a length, the `'{n}f'` used to
+    write lists of TAG_Float, falls back to `_get_struct()`.
+    """
+    __slots__ = ('prefix',)
+
+    def __init__(self, prefix):
+        super(_StructTable, self).__init__(
+            (fmt, Struct(prefix + fmt))
+            for fmt in ('b', 'h', 'H', 'i', 'q', 'f', 'd', 'bH', 'bi', '2b')
+        )
+        self.prefix = prefix
 
-def _read_big(src, fmt, size):
-    return unpack('>' + fmt, src.read(size))
+    def __missing__(self, fmt):
+        return _get_struct(self.prefix + fmt)
 
 
-def _write_little(dst, fmt, *args):
-    dst.write(pack('<' + fmt, *args))
+_big_endian = _StructTable('>')
+_little_endian = _StructTable('<')
 
 
-def _write_big(dst, fmt, *args):
-    dst.write(pack('>' + fmt, *args))
+@lru_cache(maxsize=1024)
+def _encode_name(name):
+    """
+    Encodes a tag name to MUTF-8. Files reuse the same few names for
+    thousands of tags, so each is only encoded once.
+    """
+    return mutf8.encode_modified_utf8(name)
+
+
+@lru_cache(maxsize=1024)
+def _get_named_struct(prefix, name_length, fmt):
+    """
+    Returns a `Struct` that unpacks a tag name of `name_length` bytes
+    followed immediately by a scalar payload of `fmt`.
+    """
+    return Struct('{0}{1}s{2}'.format(prefix, name_length, fmt))
+
+
+def _check_span(buf, start, end):
+    """
+    Raises `struct.error`, just as a fixed-width read would, unless
+    `start:end` is a (possibly empty) run of bytes within `buf`.
+    """
+    if end < start or end > len(buf):
+        raise StructError(
+            'cannot read {0} bytes at offset {1} from a buffer of {2}'
+            ' bytes'.format(end - start, start, len(buf))
+        )
+
+
+class _Reader(object):
+    """
+    A cursor over an in-memory NBT payload. Calling the reader unpacks
+    `fmt` at the current offset and advances past it, without any further
+    I/O or intermediate copies.
+    """
+    __slots__ = ('buf', 'pos', 'structs', 'swap')
+
+    def __init__(self, buf, little_endian=False):
+        # Slicing a memoryview doesn't copy, so raw byte runs are only ever
+        # copied once, directly into their final bytearray/array/str. The
+        # view is cast to bytes so that offsets are always byte offsets,
+        # whatever the item format of `buf`.
+        self.buf = memoryview(buf).cast('B')
+        self.pos = 0
+        self.structs = _little_endian if little_endian else _big_endian
+        # True if bulk arrays need to be byteswapped to match this machine.
+        self.swap = little_endian != (sys.byteorder == 'little')
+
+    def __call__(self, fmt, size):
+        pos = self.pos
+        self.pos = pos + size
+        return self.structs[fmt].unpack_from(self.buf, pos)
+
+    def bytes(self, size):
+        """Returns a view of the next `size` raw bytes."""
+        pos = self.pos
+        end = pos + size
+        _check_span(self.buf, pos, end)
+        self.pos = end
+        return self.buf[pos:end]
+
+
+def _write_array(write, value, typecode):
+    """
+    Writes `value` as a length-prefixed array of `typecode` items, copying
+    it out as a single block rather than packing each item.
+    """
+    if not isinstance(value, array) or value.typecode != typecode:
+        try:
+            value = array(typecode, value)
+        except OverflowError as e:
+            # Raise what struct would for an out of range item.
+            raise StructError(str(e)) from None
+    elif write.swap:
+        # Don't byteswap the caller's array in place.
+        value = value[:]
+    if write.swap:
+        value.byteswap()
+    write('i', len(value))
+    write.bytes(value)
+
+
+class _Writer(object):
+    """
+    Accumulates a serialized NBT payload in memory. Calling the writer
+    packs `args` using `fmt` onto the end of the buffer.
+    """
+    __slots__ = ('buf', 'structs', 'swap')
+
+    def __init__(self, little_endian=False):
+        self.buf = bytearray()
+        self.structs = _little_endian if little_endian else _big_endian
+        # True if bulk arrays need to be byteswapped from this machine's
+        # byte order.
+        self.swap = little_endian != (sys.byteorder == 'little')
+
+    def __call__(self, fmt, *args):
+        self.buf += self.structs[fmt].pack(*args)
+
+    def bytes(self, value):
+        """Appends the raw bytes in `value`."""
+        self.buf.extend(value)
 
 
 class NBTFile(TAG_Compound):
+    __slots__ = ()
+
     def __init__(self, io=None, name='', value=None, little_endian=False):
         """
         Creates a new NBTFile or loads one from any file-like object providing
@@ -356,19 +742,42 @@ class NBTFile(TAG_Compound):
             super().__init__(value if value else {}, name)
             return
 
+        # NBT files are small enough to comfortably fit in memory, so rather
+        # than issuing thousands of tiny reads against `io` (which is often
+        # a GzipFile) we read it all at once and parse from the buffer.
+        self._load(io.read(), little_endian)
+
+    @classmethod
+    def from_bytes(cls, data, little_endian=False):
+        """
+        Loads an NBTFile from an in-memory, uncompressed NBT payload, such
+        as a decompressed chunk.
+
+        >>> nbt = NBTFile.from_bytes(zlib.decompress(compressed))
+
+        :param data: A `bytes`-like object holding the NBT payload. Anything
+                     supporting the buffer protocol (`bytearray`,
+                     `memoryview`, ...) is parsed in place, without a copy.
+        :param little_endian: `True` if the payload is in little-endian byte
+                              order. [default: `False`]
+        """
+        nbt = cls.__new__(cls)
+        nbt._load(data, little_endian)
+        return nbt
+
+    def _load(self, data, little_endian):
         # The pocket edition uses little-endian NBT files, but annoyingly
         # without any kind of header we can't determine that ourselves,
         # not even a magic number we could flip.
-        read = _read_little if little_endian else _read_big
-        read = partial(read, io)
-        read.src = io
+        read = _Reader(data, little_endian)
 
         # All valid NBT files will begin with 0x0A, which is a TAG_Compound.
         if read('b', 1)[0] != 0x0A:
             raise IOError('NBTFile does not begin with 0x0A.')
 
         tmp = TAG_Compound.read(read)
-        super(NBTFile, self).__init__(tmp, tmp.name)
+        self.name = tmp.name
+        dict.update(self, tmp)
 
     def save(self, io, little_endian=False):
         """
@@ -379,8 +788,9 @@ class NBTFile(TAG_Compound):
         :param little_endian: `True` if little-endian byte order should be
                               used. [default: `False`]
         """
-        write = _write_little if little_endian else _write_big
-        write = partial(write, io)
-        write.dst = io
-
+        # Build the whole file in memory and hand it to `io` in one go,
+        # rather than making a write() call (often on a GzipFile) for every
+        # single field.
+        write = _Writer(little_endian)
         self.write(write)
+        io.write(write.buf)
@@ -1,8 +1,15 @@
+import struct
+from array import array
+from io import BytesIO
+
+import pytest
+
 from pynbt import (
     NBTFile,
     TAG_Byte,
     TAG_Short,
     TAG_Int,
+    TAG_Long,
     TAG_Float,
     TAG_Double,
     TAG_String,
@@ -14,7 +21,7 @@ from pynbt import (
 )
 
 
-def test_save():
+def _build():
     n = NBTFile(name='')
     n['byte'] = TAG_Byte(0)
     n['short'] = TAG_Short(1)
@@ -42,5 +49,137 @@ def test_save():
         }
     ])
 
+    return n
+
+
+def test_save():
+    n = _build()
     with open('__test__.nbt', 'wb') as io:
         n.save(io)
+
+
+@pytest.mark.parametrize('little_endian', [False, True])
+def test_roundtrip(little_endian):
+    """Reading a saved file back gives the same tree and the same bytes."""
+    with BytesIO() as out:
+        _build().save(out, little_endian=little_endian)
+        saved = out.getvalue()
+
+    n = NBTFile(BytesIO(saved), little_endian=little_endian)
+    assert n['int'].value == 2
+    assert n['double'].value == 4.
+    assert n['string'].value == 'Testing'
+    assert list(n['int_array'].value) == [45, 5, 6]
+    assert list(n['byte_array'].value) == [4, 3, 2]
+    assert list(n['long_array'].value) == [5, 6, 7]
+    assert [t.value for t in n['autolist_int']] == [5, 6, 7, 30240, -340]
+    assert n['autolist_compound'][0]['health'].value == 3.5
+
+    with BytesIO() as out:
+        n.save(out, little_endian=little_endian)
+        assert out.getvalue() == saved
+
+    # Any buffer is read as raw bytes, whatever its item format.
+    padded = saved + b'\x00' * (-len(saved) % 4)
+    for data in (memoryview(saved), array('i', padded),
+                 memoryview(padded).cast('H')):
+        n = NBTFile.from_bytes(data, little_endian=little_endian)
+        assert n['string'].value == 'Testing'
+        assert n['autolist_compound'][0]['name'].value == 'ABC'
+
+
+@pytest.mark.parametrize('little_endian', [False, True])
+def test_save_array_unchanged(little_endian):
+    """Saving must not byteswap a caller's array in place."""
+    value = array('i', [1, -2, 3])
+    n = NBTFile(name='')
+    n['int_array'] = TAG_Int_Array(value)
+
+    with BytesIO() as out:
+        n.save(out, little_endian=little_endian)
+
+    assert value == array('i', [1, -2, 3])
+
+
+def test_list_items_unnamed():
+    """Names on tags inside a TAG_List are not written."""
+    n = NBTFile(name='')
+    n['list'] = TAG_List(TAG_Int, [TAG_Int(1, name='ignored'), 2])
+
+    with BytesIO() as out:
+        n.save(out)
+        n = NBTFile(BytesIO(out.getvalue()))
+
+    assert [t.value for t in n['list']] == [1, 2]
+
+
+def test_long_strings():
+    """String lengths are unsigned, so strings up to 65535 bytes work."""
+    n = NBTFile(name='')
+    n['a' * 40000] = TAG_String('b' * 65535)
+
+    with BytesIO() as out:
+        n.save(out)
+        n = NBTFile(BytesIO(out.getvalue()))
+
+    assert n['a' * 40000].value == 'b' * 65535
+
+
+@pytest.mark.parametrize('tag,value,error', [
+    (TAG_Byte, 200, struct.error),
+    (TAG_Short, 2 ** 15, struct.error),
+    (TAG_Int, 2 ** 31, struct.error),
+    (TAG_Long, 2 ** 63, struct.error),
+    (TAG_Float, 1e300, OverflowError)
+])
+def test_list_out_of_range(tag, value, error):
+    """Out of range values in a TAG_List raise the same as a lone tag."""
+    for t in (tag(value), TAG_List(tag, [1, value])):
+        n = NBTFile(name='')
+        n['t'] = t
+        with pytest.raises(error):
+            n.save(BytesIO())
+
+
+def test_assign_value():
+    """Assigning to .value replaces the contents of a list or compound."""
+    lst = TAG_List(TAG_Int, [1, 2, 3])
+    lst.value = [4, 5]
+    assert lst.value is lst
+    assert lst == [4, 5]
+
+    c = TAG_Compound({'a': TAG_Int(1)})
+    c.value = {'b': TAG_Int(2), 'c': TAG_Int(3, name='named')}
+    assert c.value is c
+    assert list(c) == ['b', 'c']
+    assert c['b'].name == 'b'
+    assert c['c'].name == 'named'
+
+    # Assigning a compound to itself leaves it untouched.
+    c.value = c
+    assert list(c) == ['b', 'c']
+
+
+def test_update():
+    """update() names new tags after their keys, like __setitem__."""
+    c = TAG_Compound({'a': TAG_Int(1, name='kept')})
+    c.update({'b': TAG_Int(2)}, c=TAG_Int(3))
+    c.update([('d', TAG_Int(4))])
+    assert [(k, v.name, v.value) for k, v in c.items()] == [
+        ('a', 'kept', 1),
+        ('b', 'b', 2),
+        ('c', 'c', 3),
+        ('d', 'd', 4)
+    ]
+
+
+@pytest.mark.parametrize('tag,value', [
+    (TAG_Int_Array, 2 ** 40),
+    (TAG_Long_Array, 2 ** 64)
+])
+def test_array_out_of_range(tag, value):
+    """Out of range items in an array tag raise struct.error."""
+    n = NBTFile(name='')
+    n['a'] = tag([1, value])
+    with pytest.raises(struct.error):
+        n.save(BytesIO())
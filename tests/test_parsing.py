@@ -0,0 +1,42 @@
+import struct
+
+import pytest
+
+from pynbt import NBTFile, TAG_Byte
+
+
+def test_truncated_list():
+    """Running off the end of the payload is an error, not a short read."""
+    # A TAG_List of 3 TAG_Ints, with only one int present.
+    data = b'\x0a\x00\x00\x09\x00\x01L\x03\x00\x00\x00\x03\x00\x00\x00\x01'
+    with pytest.raises(struct.error):
+        NBTFile.from_bytes(data)
+
+
+def test_negative_list_length():
+    """A TAG_List with a negative length is read as an empty list."""
+    # A TAG_List of TAG_Byte with a length of -9.
+    data = b'\x0a\x00\x00\x09\x00\x01L\x01\xff\xff\xff\xf7\x00'
+    n = NBTFile.from_bytes(data)
+    assert n['L'].type_ is TAG_Byte
+    assert len(n['L']) == 0
+
+
+@pytest.mark.parametrize('data', [
+    # A TAG_Byte_Array with a length of -8.
+    b'\x0a\x00\x00\x07\x00\x01A\xff\xff\xff\xf8\x00',
+    # A TAG_Int_Array with a length of -2.
+    b'\x0a\x00\x00\x0b\x00\x01A\xff\xff\xff\xfe\x00',
+    # A TAG_Long_Array of 2 longs, with only one present.
+    b'\x0a\x00\x00\x0c\x00\x01A\x00\x00\x00\x02' + b'\x00' * 8,
+    # A TAG_String of 10 bytes, with only 3 present.
+    b'\x0a\x00\x00\x08\x00\x01S\x00\x0aabc',
+    # A tag name of 10 bytes, with only 3 present.
+    b'\x0a\x00\x00\x07\x00\x0aabc',
+    # A compound with no TAG_End.
+    b'\x0a\x00\x00\x01\x00\x01a\x05',
+])
+def test_corrupt_lengths(data):
+    """Negative or overlong lengths are rejected rather than followed."""
+    with pytest.raises(struct.error):
+        NBTFile.from_bytes(data)